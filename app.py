@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import hmac
 import os
 import json
 import time
 from pathlib import Path
 
+import numpy as np
+import openpyxl
 import pandas as pd
 import streamlit as st
 from google.oauth2.service_account import Credentials
@@ -22,23 +27,61 @@ ALLOWED_PIN = "1020"
 MAX_LOGIN_ATTEMPTS = int(os.environ.get("MAX_LOGIN_ATTEMPTS", "5"))
 LOCKOUT_SECONDS = int(os.environ.get("LOCKOUT_SECONDS", "900"))
 
+# Characters stripped from currency strings before numeric conversion.
+_CURRENCY_DEL = str.maketrans("", "", "£$€, \t")
+
+_NS_PER_DAY = 86_400_000_000_000
+
+# On-disk write-through cache for live sheet data, keyed by Drive revision.
+CACHE_DIR = Path.home() / ".cache" / "partner_dashboard"
+
+# Service-account material lives here, keyed by content hash, so the cached
+# live reader receives a short stable key instead of a secret dict that
+# Streamlit would deep-copy and hash on every rerun.
+_CREDENTIALS_REGISTRY: dict[str, dict] = {}
+
+
+def register_credentials(info) -> str:
+    # info may be Streamlit's AttrDict (a Mapping, not a dict subclass),
+    # which json.dumps refuses; service-account JSON is flat, so dict() is
+    # enough to make it serializable.
+    info = dict(info)
+    key = hashlib.sha256(json.dumps(info, sort_keys=True).encode()).hexdigest()
+    if key not in _CREDENTIALS_REGISTRY:
+        _CREDENTIALS_REGISTRY[key] = info
+    return key
+
 
 @st.cache_data(show_spinner=False)
 def read_partner_sheet(path: str) -> pd.DataFrame:
-    df = pd.read_excel(path, sheet_name=PARTNER_SHEET)
+    # read_only streams rows for just the partner sheet instead of loading
+    # the whole workbook DOM, which keeps memory near file size.
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb[PARTNER_SHEET].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        df = pd.DataFrame(rows, columns=[str(c).strip() for c in header])
+    finally:
+        wb.close()
     df = df.dropna(axis=1, how="all")
-    df.columns = [str(c).strip() for c in df.columns]
     df = df.dropna(how="all").reset_index(drop=True)
-    return df
+    return optimize_dtypes(df)
 
 
 def normalize_colname(name: str) -> str:
     return " ".join(str(name).strip().lower().split())
 
 
+@functools.lru_cache(maxsize=None)
+def _column_map(columns: tuple[str, ...]) -> dict[str, str]:
+    return {normalize_colname(c): c for c in columns}
+
+
 def resolve_column(df: pd.DataFrame, target: str, aliases: list[str] | None = None) -> str | None:
     wanted = [target] + (aliases or [])
-    normalized_to_actual = {normalize_colname(c): c for c in df.columns}
+    normalized_to_actual = _column_map(tuple(df.columns))
     for w in wanted:
         match = normalized_to_actual.get(normalize_colname(w))
         if match:
@@ -46,6 +89,23 @@ def resolve_column(df: pd.DataFrame, target: str, aliases: list[str] | None = No
     return None
 
 
+def optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    # Arrow-backed strings keep the partner names (which back the contains
+    # search) in contiguous UTF-8 buffers; the low-cardinality filter columns
+    # become categoricals so equality and isin compare int8 codes.
+    name_col = resolve_column(df, "Dealership Group Name")
+    if name_col is not None:
+        df[name_col] = df[name_col].astype("string[pyarrow]")
+    # Strip and blank-out the filter values here so apply_filters can use the
+    # columns directly without rebuilding strings on every rerun.
+    for target in ("Risk banding", "CPL or Flat Rate"):
+        col = resolve_column(df, target)
+        if col is not None:
+            cleaned = df[col].astype("string[pyarrow]").str.strip().replace("", pd.NA)
+            df[col] = cleaned.astype("category")
+    return df
+
+
 def resolve_renewal_column(df: pd.DataFrame) -> str | None:
     resolved = resolve_column(
         df,
@@ -66,14 +126,16 @@ def read_partner_sheet_live(
     sheet_id: str,
     credentials_path: str | None = None,
     credentials_json: str | None = None,
-    credentials_info: dict | None = None,
+    credentials_key: str | None = None,
 ) -> pd.DataFrame:
     scopes = [
         "https://www.googleapis.com/auth/spreadsheets.readonly",
         "https://www.googleapis.com/auth/drive.readonly",
     ]
-    if credentials_info:
-        creds = Credentials.from_service_account_info(credentials_info, scopes=scopes)
+    if credentials_key:
+        creds = Credentials.from_service_account_info(
+            _CREDENTIALS_REGISTRY[credentials_key], scopes=scopes
+        )
     elif credentials_json:
         creds_info = json.loads(credentials_json)
         creds = Credentials.from_service_account_info(creds_info, scopes=scopes)
@@ -82,21 +144,56 @@ def read_partner_sheet_live(
     else:
         raise ValueError("No Google service account credentials provided.")
     client = gspread.authorize(creds)
-    ws = client.open_by_key(sheet_id).worksheet(PARTNER_SHEET)
-    values = ws.get_all_values()
+    sheet = client.open_by_key(sheet_id)
+
+    # Parquet write-through keyed on the sheet's Drive revision: once any
+    # worker has fetched a revision, later cold starts read the columnar
+    # file in milliseconds instead of re-downloading and re-parsing.
+    cache_path = None
+    try:
+        revision = sheet.get_lastUpdateTime()
+    except Exception:
+        revision = None
+    if revision:
+        cache_path = CACHE_DIR / f"{sheet_id}_{revision.replace(':', '-')}.parquet"
+        if cache_path.exists():
+            return pd.read_parquet(cache_path)
+
+    ws = sheet.worksheet(PARTNER_SHEET)
+    # Bounded range with unformatted values: smaller payload than
+    # get_all_values, and date cells arrive as spreadsheet serial numbers
+    # instead of locale-formatted strings.
+    values = ws.get(
+        "A:Z",
+        value_render_option="UNFORMATTED_VALUE",
+        date_time_render_option="SERIAL_NUMBER",
+    )
 
     if not values:
         return pd.DataFrame()
 
     headers = [str(c).strip() for c in values[0]]
-    rows = values[1:]
+    # ws.get trims trailing empty cells per row; clip to the header width so
+    # row lengths line up (short rows are padded with NaN by the constructor).
+    rows = [r[: len(headers)] for r in values[1:]]
     df = pd.DataFrame(rows, columns=headers)
     df = df.dropna(axis=1, how="all")
     df = df.dropna(how="all").reset_index(drop=True)
+    df = optimize_dtypes(df)
+
+    if cache_path is not None:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(cache_path)
+        except Exception:
+            pass  # Disk cache is best-effort; the data is already in memory.
     return df
 
 
+@st.cache_data(show_spinner=False)
 def normalize_partners(df: pd.DataFrame, as_of_date: pd.Timestamp) -> pd.DataFrame:
+    # Cached so date parsing, currency cleaning and sorting only rerun when
+    # the underlying data or the as-of date changes, not on every widget click.
     out = df.copy()
     partner_col = resolve_column(out, "Dealership Group Name")
     if partner_col is None:
@@ -108,32 +205,69 @@ def normalize_partners(df: pd.DataFrame, as_of_date: pd.Timestamp) -> pd.DataFra
     if renewal_col is None:
         raise KeyError(f"Could not find renewal date column matching '{RENEWAL_COLUMN}'.")
 
-    # Parse renewal dates as ISO first (YYYY-MM-DD), then fallback without day-first.
+    # Parse renewal dates. The Excel loader delivers a datetime64 column,
+    # which to_numeric would turn into epoch integers rather than NaN, so the
+    # serial-number path is reserved for object/string columns: spreadsheet
+    # serials first (the live sheet sends UNFORMATTED_VALUE), then one
+    # mixed-format pass over whatever remains as strings.
     raw_renewal = out[renewal_col]
-    parsed_iso = pd.to_datetime(raw_renewal, format="%Y-%m-%d", errors="coerce")
-    parsed_fallback = pd.to_datetime(raw_renewal, errors="coerce", dayfirst=False)
-    out["Renewal Date (Working)"] = parsed_iso.fillna(parsed_fallback)
+    if pd.api.types.is_datetime64_any_dtype(raw_renewal):
+        out["Renewal Date (Working)"] = pd.to_datetime(raw_renewal, errors="coerce")
+    else:
+        serial = pd.to_numeric(raw_renewal, errors="coerce")
+        parsed_serial = pd.to_datetime(
+            serial, unit="D", origin="1899-12-30", errors="coerce"
+        )
+        remaining = raw_renewal.where(serial.isna())
+        parsed_rest = pd.to_datetime(remaining, errors="coerce", format="mixed", dayfirst=False)
+        out["Renewal Date (Working)"] = parsed_serial.fillna(parsed_rest)
     if "CPL" in out.columns:
         out["CPL_numeric"] = pd.to_numeric(out["CPL"], errors="coerce")
-        out["Cohort"] = out["CPL_numeric"].apply(
-            lambda v: FACEBOOK_COHORT if v in (15.0, 18.0) else OTHER_COHORT
+        cohort = np.where(
+            out["CPL_numeric"].isin([15.0, 18.0]), FACEBOOK_COHORT, OTHER_COHORT
         )
     else:
-        out["Cohort"] = OTHER_COHORT
+        cohort = np.full(len(out), OTHER_COHORT, dtype=object)
+    # Two fixed categories: cohort equality checks compare int8 codes.
+    out["Cohort"] = pd.Categorical(cohort, categories=[FACEBOOK_COHORT, OTHER_COHORT])
 
     if "Monthly subscription cost" in out.columns:
-        cost_clean = (
-            out["Monthly subscription cost"]
-            .astype(str)
-            .str.replace(r"[^0-9.-]", "", regex=True)
-        )
+        cost_clean = [
+            s.translate(_CURRENCY_DEL) if isinstance(s, str) else s
+            for s in out["Monthly subscription cost"].to_numpy()
+        ]
         out["Monthly subscription cost numeric"] = pd.to_numeric(cost_clean, errors="coerce")
     else:
-        out["Monthly subscription cost numeric"] = pd.NA
+        out["Monthly subscription cost numeric"] = np.nan
+
+    out = out.dropna(subset=["Dealership Group Name", "Renewal Date (Working)"])
 
-    out = out.dropna(subset=["Dealership Group Name", "Renewal Date (Working)"]).copy()
-    out["Days to Renewal"] = (out["Renewal Date (Working)"].dt.normalize() - as_of_date).dt.days
-    out = out.sort_values(["Renewal Date (Working)", "Dealership Group Name"]).reset_index(
+    # Project down to the columns the dashboard actually reads (display
+    # tables, filters, aggregations) so the sort and every downstream slice
+    # move only the data that will be used.
+    keep = [
+        "Dealership Group ID",
+        "Dealership Group Name",
+        "CPL or Flat Rate",
+        "CPL",
+        "CPL_numeric",
+        "Cohort",
+        "Monthly subscription cost",
+        "Monthly subscription cost numeric",
+        "Renewal Date (Working)",
+    ]
+    risk_col = resolve_column(out, "Risk banding")
+    if risk_col is not None:
+        keep.append(risk_col)
+    out = out[[c for c in keep if c in out.columns]]
+    # Integer floor-division of the raw ns values replicates
+    # normalize().days (as_of_date is midnight) without materializing a
+    # normalized datetime column first.
+    renewal_ns = out["Renewal Date (Working)"].to_numpy(dtype="datetime64[ns]").view("i8")
+    out["Days to Renewal"] = (renewal_ns - as_of_date.value) // _NS_PER_DAY
+    # Sort on Days to Renewal so the bucket slices downstream can binary-search
+    # instead of scanning.
+    out = out.sort_values(["Days to Renewal", "Dealership Group Name"]).reset_index(
         drop=True
     )
     return out
@@ -142,47 +276,65 @@ def normalize_partners(df: pd.DataFrame, as_of_date: pd.Timestamp) -> pd.DataFra
 def apply_filters(df: pd.DataFrame) -> pd.DataFrame:
     st.sidebar.header("Filters")
 
-    filtered = df.copy()
+    filtered = df
     risk_col = resolve_column(filtered, "Risk banding")
     if risk_col:
-        risk_values = (
-            filtered[risk_col]
-            .astype(str)
-            .str.strip()
-            .replace("", pd.NA)
-            .dropna()
-            .unique()
-            .tolist()
-        )
-        risk_options = sorted(risk_values)
+        # Values are stripped and categorized at load, so the options and the
+        # isin test use the column as-is.
+        risk_options = sorted(filtered[risk_col].dropna().unique().tolist())
         selected_risk = st.sidebar.multiselect(
             "Risk banding", risk_options, default=risk_options
         )
         if selected_risk:
-            filtered = filtered[
-                filtered[risk_col].astype(str).str.strip().isin(selected_risk)
-            ]
+            filtered = filtered[filtered[risk_col].isin(selected_risk)]
 
     if "CPL or Flat Rate" in filtered.columns:
-        options = sorted(filtered["CPL or Flat Rate"].dropna().astype(str).unique().tolist())
+        options = sorted(filtered["CPL or Flat Rate"].dropna().unique().tolist())
         selected = st.sidebar.multiselect("CPL or Flat Rate", options, default=options)
         if selected:
-            filtered = filtered[filtered["CPL or Flat Rate"].astype(str).isin(selected)]
+            filtered = filtered[filtered["CPL or Flat Rate"].isin(selected)]
 
     if "Dealership Group Name" in filtered.columns:
         query = st.sidebar.text_input("Partner name contains")
         if query:
+            # regex=False dispatches to Arrow's substring kernel on the
+            # string[pyarrow] column instead of Python's re per cell.
             filtered = filtered[
-                filtered["Dealership Group Name"]
-                .astype(str)
-                .str.contains(query, case=False, na=False)
+                filtered["Dealership Group Name"].str.contains(
+                    query, case=False, regex=False, na=False
+                )
             ]
 
     return filtered
 
 
-def renewal_bucket(df: pd.DataFrame, min_days: int, max_days: int) -> pd.DataFrame:
-    return df[(df["Days to Renewal"] >= min_days) & (df["Days to Renewal"] <= max_days)].copy()
+BUCKET_LABELS = {
+    0: "0-30 days",
+    1: "31-60 days",
+    2: "61-90 days",
+    3: "90+ days",
+    4: "Overdue",
+}
+
+
+# Maps the bin index from searchsorted over (0, 31, 61, 91) onto bucket codes.
+_BUCKET_BY_BIN = np.array([4, 0, 1, 2, 3], dtype=np.int8)
+
+
+def assign_buckets(df: pd.DataFrame) -> pd.DataFrame:
+    # Encode the renewal bucket once so downstream splits and the cohort
+    # summary are single equality filters instead of repeated range scans.
+    # Binning via searchsorted + a lookup table writes one int8 array rather
+    # than allocating a boolean mask per bucket.
+    days = df["Days to Renewal"].to_numpy()
+    bins = np.searchsorted([0, 31, 61, 91], days, side="right")
+    df["bucket"] = _BUCKET_BY_BIN[bins]
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    return df.to_csv(index=False).encode("utf-8")
 
 
 def display_partner_table(df: pd.DataFrame, title: str, download_key: str) -> None:
@@ -202,24 +354,35 @@ def display_partner_table(df: pd.DataFrame, title: str, download_key: str) -> No
         "Days to Renewal",
     ]
     columns = [c for c in preferred_cols if c in df.columns]
-    table = df[columns].copy()
+    # Column selection already detaches from df; use assign for the reworked
+    # columns rather than copying the whole frame.
+    table = df[columns]
     if (
         "Monthly subscription cost numeric" in df.columns
         and "Monthly subscription cost" in table.columns
     ):
-        table["Monthly subscription cost"] = pd.to_numeric(
-            df.loc[table.index, "Monthly subscription cost numeric"], errors="coerce"
+        table = table.assign(
+            **{
+                "Monthly subscription cost": pd.to_numeric(
+                    df.loc[table.index, "Monthly subscription cost numeric"],
+                    errors="coerce",
+                )
+            }
         )
     if "Renewal Date (Working)" in table.columns:
-        table["Renewal Date (Working)"] = pd.to_datetime(
-            table["Renewal Date (Working)"], errors="coerce"
-        ).dt.date
+        table = table.assign(
+            **{
+                "Renewal Date (Working)": pd.to_datetime(
+                    table["Renewal Date (Working)"], errors="coerce"
+                ).dt.date
+            }
+        )
     table = table.sort_values(
         ["Days to Renewal", "Renewal Date (Working)", "Dealership Group Name"]
     )
     st.dataframe(table, use_container_width=True, hide_index=True)
 
-    csv = table.to_csv(index=False).encode("utf-8")
+    csv = _to_csv_bytes(table)
     file_stub = title.lower().replace(" ", "_")
     st.download_button(
         label=f"Download {title} CSV",
@@ -256,6 +419,13 @@ def display_bucket_by_cohort(df: pd.DataFrame, bucket_label: str, key_prefix: st
         )
 
 
+@st.fragment
+def _render_bucket(df: pd.DataFrame, bucket_label: str, key_prefix: str) -> None:
+    # Fragment boundary: interactions inside a bucket tab rerun only this
+    # render, not the whole load/normalize/filter pipeline.
+    display_bucket_by_cohort(df, bucket_label, key_prefix)
+
+
 def format_currency(value: float) -> str:
     return f"£{round(value):,}"
 
@@ -293,7 +463,10 @@ def require_login() -> str:
     if submit:
         if not name.strip():
             st.error("Name is required.")
-        elif name.strip() != ALLOWED_NAME or pin != ALLOWED_PIN:
+        elif not (
+            hmac.compare_digest(name.strip().encode(), ALLOWED_NAME.encode())
+            and hmac.compare_digest(pin.encode(), ALLOWED_PIN.encode())
+        ):
             st.session_state["failed_attempts"] += 1
             attempts_left = MAX_LOGIN_ATTEMPTS - st.session_state["failed_attempts"]
             if attempts_left <= 0:
@@ -387,7 +560,9 @@ def main() -> None:
                 sheet_id.strip(),
                 credentials_path=str(creds_file) if creds_file else None,
                 credentials_json=credentials_json or None,
-                credentials_info=dict(credentials_info) if credentials_info else None,
+                credentials_key=(
+                    register_credentials(credentials_info) if credentials_info else None
+                ),
             )
         except Exception as exc:
             st.error(f"Could not read live Google Sheet: {exc}")
@@ -416,68 +591,53 @@ def main() -> None:
 
     partners = normalize_partners(df, as_of_date)
     partners = apply_filters(partners)
-
-    overdue = partners[partners["Days to Renewal"] < 0].copy()
-    in_30 = renewal_bucket(partners, 0, 30)
-    in_60 = renewal_bucket(partners, 31, 60)
-    in_90 = renewal_bucket(partners, 61, 90)
-    over_90 = partners[partners["Days to Renewal"] > 90].copy()
+    partners = assign_buckets(partners)
+
+    # Days to Renewal is sorted ascending (filters preserve order), so each
+    # bucket is a contiguous slice found by binary search rather than a scan.
+    days = partners["Days to Renewal"].to_numpy()
+    edges = np.searchsorted(days, [0, 31, 61, 91])
+    overdue = partners.iloc[: edges[0]]
+    in_30 = partners.iloc[edges[0] : edges[1]]
+    in_60 = partners.iloc[edges[1] : edges[2]]
+    in_90 = partners.iloc[edges[2] : edges[3]]
+    over_90 = partners.iloc[edges[3] :]
+
+    # One grouped pass produces every metric-card count and revenue sum.
+    agg = (
+        partners.groupby("bucket", observed=True)
+        .agg(
+            count=("bucket", "size"),
+            revenue=("Monthly subscription cost numeric", "sum"),
+        )
+        .reindex(range(5), fill_value=0)
+    )
 
     c1, c2, c3, c4, c5 = st.columns(5)
-    c1.metric("Renewing in 0-30 days", f"{len(in_30):,}")
-    c2.metric("Renewing in 31-60 days", f"{len(in_60):,}")
-    c3.metric("Renewing in 61-90 days", f"{len(in_90):,}")
-    c4.metric("Overdue", f"{len(overdue):,}")
-    c5.metric("Renewing in 90+ days", f"{len(over_90):,}")
+    c1.metric("Renewing in 0-30 days", f"{agg.loc[0, 'count']:,}")
+    c2.metric("Renewing in 31-60 days", f"{agg.loc[1, 'count']:,}")
+    c3.metric("Renewing in 61-90 days", f"{agg.loc[2, 'count']:,}")
+    c4.metric("Overdue", f"{agg.loc[4, 'count']:,}")
+    c5.metric("Renewing in 90+ days", f"{agg.loc[3, 'count']:,}")
 
     r1, r2, r3, r4, r5 = st.columns(5)
-    r1.metric(
-        "Revenue 0-30 days",
-        format_currency(in_30["Monthly subscription cost numeric"].fillna(0).sum()),
-    )
-    r2.metric(
-        "Revenue 31-60 days",
-        format_currency(in_60["Monthly subscription cost numeric"].fillna(0).sum()),
-    )
-    r3.metric(
-        "Revenue 61-90 days",
-        format_currency(in_90["Monthly subscription cost numeric"].fillna(0).sum()),
-    )
-    r4.metric(
-        "Revenue overdue",
-        format_currency(overdue["Monthly subscription cost numeric"].fillna(0).sum()),
-    )
-    r5.metric(
-        "Revenue 90+ days",
-        format_currency(over_90["Monthly subscription cost numeric"].fillna(0).sum()),
-    )
+    r1.metric("Revenue 0-30 days", format_currency(agg.loc[0, "revenue"]))
+    r2.metric("Revenue 31-60 days", format_currency(agg.loc[1, "revenue"]))
+    r3.metric("Revenue 61-90 days", format_currency(agg.loc[2, "revenue"]))
+    r4.metric("Revenue overdue", format_currency(agg.loc[4, "revenue"]))
+    r5.metric("Revenue 90+ days", format_currency(agg.loc[3, "revenue"]))
 
     st.subheader("Renewals by Cohort")
-    summary = pd.DataFrame(
-        {
-            "Cohort": [FACEBOOK_COHORT, OTHER_COHORT],
-            "0-30 days": [
-                len(in_30[in_30["Cohort"] == FACEBOOK_COHORT]),
-                len(in_30[in_30["Cohort"] == OTHER_COHORT]),
-            ],
-            "31-60 days": [
-                len(in_60[in_60["Cohort"] == FACEBOOK_COHORT]),
-                len(in_60[in_60["Cohort"] == OTHER_COHORT]),
-            ],
-            "61-90 days": [
-                len(in_90[in_90["Cohort"] == FACEBOOK_COHORT]),
-                len(in_90[in_90["Cohort"] == OTHER_COHORT]),
-            ],
-            "Overdue": [
-                len(overdue[overdue["Cohort"] == FACEBOOK_COHORT]),
-                len(overdue[overdue["Cohort"] == OTHER_COHORT]),
-            ],
-            "90+ days": [
-                len(over_90[over_90["Cohort"] == FACEBOOK_COHORT]),
-                len(over_90[over_90["Cohort"] == OTHER_COHORT]),
-            ],
-        }
+    counts = (
+        partners.groupby(["Cohort", "bucket"], observed=True)
+        .size()
+        .unstack(fill_value=0)
+        .reindex(index=[FACEBOOK_COHORT, OTHER_COHORT], columns=range(5), fill_value=0)
+        .rename(columns=BUCKET_LABELS)
     )
+    summary = counts.reset_index()[
+        ["Cohort", "0-30 days", "31-60 days", "61-90 days", "Overdue", "90+ days"]
+    ]
     summary["Total"] = summary[
         ["0-30 days", "31-60 days", "61-90 days", "90+ days", "Overdue"]
     ].sum(axis=1)
@@ -489,15 +649,15 @@ def main() -> None:
     )
 
     with tab30:
-        display_bucket_by_cohort(in_30, "Partners Renewing in 0-30 Days", "bucket_0_30")
+        _render_bucket(in_30, "Partners Renewing in 0-30 Days", "bucket_0_30")
     with tab60:
-        display_bucket_by_cohort(in_60, "Partners Renewing in 31-60 Days", "bucket_31_60")
+        _render_bucket(in_60, "Partners Renewing in 31-60 Days", "bucket_31_60")
     with tab90:
-        display_bucket_by_cohort(in_90, "Partners Renewing in 61-90 Days", "bucket_61_90")
+        _render_bucket(in_90, "Partners Renewing in 61-90 Days", "bucket_61_90")
     with tab_over_90:
-        display_bucket_by_cohort(over_90, "Partners Renewing in 90+ Days", "bucket_over_90")
+        _render_bucket(over_90, "Partners Renewing in 90+ Days", "bucket_over_90")
     with tab_overdue:
-        display_bucket_by_cohort(overdue, "Partners Overdue for Renewal", "bucket_overdue")
+        _render_bucket(overdue, "Partners Overdue for Renewal", "bucket_overdue")
 
 
 if __name__ == "__main__":